@@ -6,16 +6,20 @@ import time
 import pandas as pd
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
-from threading import Thread, Event
+from threading import Thread, Event, Lock
 import queue
 import sys
 import os
 import webbrowser
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 from requests.adapters import HTTPAdapter, Retry
 import matplotlib.pyplot as plt
 import analisis_avanzado  # Importa el módulo para el análisis avanzado
 import re
+import math
+import heapq
+import zlib
+import argparse
 
 # Obtener la ruta del directorio actual donde se ejecuta el script
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -66,6 +70,13 @@ if not all([TANGO_API_TOKEN, TANGO_COMPANY_ID, AFIP_USER, AFIP_API_KEY]):
     print("Error: Falta alguna clave en el archivo de claves.")
     sys.exit()
 
+# Consultas simultáneas a Mr. Bot (opcional; por defecto 1, es decir una consulta a la vez)
+try:
+    AFIP_CONSULTAS_SIMULTANEAS = max(1, int(claves.get('AFIP_CONSULTAS_SIMULTANEAS', 1)))
+except ValueError:
+    logging.warning("AFIP_CONSULTAS_SIMULTANEAS inválido en el archivo de claves; se usa 1.")
+    AFIP_CONSULTAS_SIMULTANEAS = 1
+
 # Configuración de la sesión de requests con reintentos
 def configurar_sesion():
     session = requests.Session()
@@ -102,14 +113,14 @@ def obtener_datos_tango(process, page_size=10000, page_index=0):
         return []
 
 # Función para obtener el número total de páginas de la API de Tango
-def obtener_paginacion_tango(process):
+def obtener_paginacion_tango(process, page_size=5000):
     headers = {
         "ApiAuthorization": TANGO_API_TOKEN,
         "Company": TANGO_COMPANY_ID
     }
     params = {
         "process": process,
-        "pageSize": 5000,
+        "pageSize": page_size,
         "pageIndex": 0,
         "view": ""
     }
@@ -147,15 +158,87 @@ def validar_cuit_afip(cuit):
         print(f"Error al decodificar la respuesta JSON de AFIP para el CUIT {cuit}: {e}")
         return {"error": "Error al decodificar la respuesta JSON"}
 
+# Consultas a la API de AFIP en curso, indexadas por CUIT normalizado (single-flight)
+_consultas_en_curso = {}
+_consultas_lock = Lock()
+
+# Función para normalizar el CUIT (sin guiones ni espacios)
+def normalizar_cuit(cuit):
+    return str(cuit).replace("-", "").replace(" ", "")
+
+# Función para validar CUIT compartiendo la consulta entre pedidos concurrentes del mismo CUIT
+def validar_cuit_afip_compartido(cuit):
+    cuit_normalizado = normalizar_cuit(cuit)
+    with _consultas_lock:
+        future = _consultas_en_curso.get(cuit_normalizado)
+        es_lider = future is None
+        if es_lider:
+            future = Future()
+            _consultas_en_curso[cuit_normalizado] = future
+    if es_lider:
+        # Solo el primer pedido consulta la API; el resto espera el mismo resultado
+        try:
+            future.set_result(validar_cuit_afip(int(cuit_normalizado)))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with _consultas_lock:
+                _consultas_en_curso.pop(cuit_normalizado, None)
+    else:
+        logging.info(f"Consulta en curso reutilizada para el CUIT {cuit_normalizado}")
+    return future.result()
+
+# Función para validar cada CUIT una sola vez a través de la consulta compartida
+def validar_cuits_agrupados(cuits, stop_event=None, al_completar=None, max_workers=AFIP_CONSULTAS_SIMULTANEAS):
+    resultados = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {executor.submit(validar_cuit_afip_compartido, cuit): cuit for cuit in dict.fromkeys(cuits)}
+    try:
+        for future in as_completed(futures):
+            cuit = futures[future]
+            try:
+                resultados[cuit] = future.result()
+            except ValueError:
+                resultados[cuit] = {"error": "CUIT con formato inválido"}
+            except Exception as e:
+                logging.error(f"Error al validar el CUIT {cuit}: {e}")
+                print(f"Error al validar el CUIT {cuit}: {e}")
+                resultados[cuit] = None
+            if al_completar:
+                al_completar(cuit)
+            if stop_event is not None and stop_event.is_set():
+                break
+    finally:
+        # Al detener el proceso se cancelan las consultas que todavía no empezaron
+        executor.shutdown(wait=False, cancel_futures=True)
+    return resultados
+
 # Función para validar CUITs en paralelo
 def validar_cuits_en_paralelo(clientes):
-    resultados = []
-    with ThreadPoolExecutor(max_workers=5) as executor:  # 5 hilos simultáneos
-        futures = [executor.submit(validar_cuit_afip, cliente["CUIT"]) for cliente in clientes]
-        for future, cliente in zip(futures, clientes):
-            resultado = future.result()
-            resultados.append({"cliente": cliente, "validacion": resultado})
-    return resultados
+    # Sucursales, registros duplicados y variantes "F" comparten CUIT: se consulta una vez por CUIT
+    resultados = validar_cuits_agrupados((normalizar_cuit(cliente["CUIT"]) for cliente in clientes), max_workers=5)  # 5 hilos simultáneos
+    # Repartir el resultado a todos los clientes que comparten el CUIT, en el orden original
+    return [
+        {"cliente": cliente, "validacion": resultados.get(normalizar_cuit(cliente["CUIT"]))}
+        for cliente in clientes
+    ]
+
+# Función para obtener todos los clientes de la API de Tango Gestión (None si la lectura no fue completa)
+def obtener_todos_los_clientes_tango(process="2117", page_size=5000):
+    # Las páginas se cuentan y se piden con el mismo tamaño para que ninguna quede vacía
+    total_pages = obtener_paginacion_tango(process=process, page_size=page_size)
+    if total_pages == 0:
+        return None
+    clientes = []
+    for page_index in range(total_pages):
+        clientes_pagina = obtener_datos_tango(process=process, page_size=page_size, page_index=page_index)
+        if not clientes_pagina:
+            # Una lista parcial haría desaparecer clientes vigentes: se descarta toda la lectura
+            logging.error(f"No se pudo obtener la página {page_index + 1}/{total_pages} de clientes de Tango.")
+            print(f"No se pudo obtener la página {page_index + 1}/{total_pages} de clientes de Tango.")
+            return None
+        clientes.extend(clientes_pagina)
+    return clientes
 
 # Función para filtrar clientes según condiciones
 def filtrar_clientes(clientes):
@@ -179,6 +262,59 @@ def guardar_parcialmente(resultados, filename="parcial_resultados.csv"):
     df = pd.DataFrame(resultados)
     df.to_csv(filename, index=False, mode='a', header=not os.path.exists(filename))
 
+# Función para exportar los datos del dashboard pre-agregados y paginados en JSON
+def exportar_datos_dashboard(df, directorio, filas_por_pagina=500, top_n=20):
+    os.makedirs(directorio, exist_ok=True)
+    columnas = ["Código de Cliente", "Cuit", "RAZON_SOCI", "Detalles de la Baja"]
+    df = df.reindex(columns=columnas).fillna("").astype(str)
+    detalles = df["Detalles de la Baja"]
+
+    # Agregados: el dashboard los carga al inicio sin leer las filas
+    conteo_categorias = detalles[detalles != ""].value_counts()
+    palabras = detalles.str.lower().str.split(r"\W+", regex=True).explode()
+    conteo_palabras = palabras[palabras.str.len() > 2].value_counts().head(50)
+
+    # Filas paginadas: el dashboard las pide a demanda. Cada exportación usa su propia versión en el
+    # nombre, así el resumen anterior sigue apuntando a páginas existentes hasta que se reemplaza
+    version = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    filas = df.values.tolist()
+    total_paginas = math.ceil(len(filas) / filas_por_pagina)
+    for pagina in range(total_paginas):
+        inicio = pagina * filas_por_pagina
+        with open(os.path.join(directorio, f"filas_{version}_{pagina:05d}.json"), 'w', encoding='utf-8') as f:
+            json.dump(filas[inicio:inicio + filas_por_pagina], f, ensure_ascii=False)
+
+    resumen = {
+        "version": version,
+        "columnas": columnas,
+        "total_filas": len(filas),
+        "total_con_bajas": int((detalles != "").sum()),
+        "filas_por_pagina": filas_por_pagina,
+        "total_paginas": total_paginas,
+        "categorias": [[detalle, int(cantidad)] for detalle, cantidad in conteo_categorias.items()],
+        "top_mensajes": [[detalle, int(cantidad)] for detalle, cantidad in conteo_categorias.head(top_n).items()],
+        "palabras": [[palabra, int(cantidad)] for palabra, cantidad in conteo_palabras.items()],
+    }
+    # Versión del resumen que se reemplaza: un dashboard ya abierto puede seguir pidiendo sus páginas
+    resumen_path = os.path.join(directorio, "resumen.json")
+    version_anterior = None
+    try:
+        with open(resumen_path, 'r', encoding='utf-8') as f:
+            version_anterior = json.load(f).get("version")
+    except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+        pass
+
+    # Escribir el resumen en un archivo temporal y reemplazarlo de forma atómica
+    with open(resumen_path + ".tmp", 'w', encoding='utf-8') as f:
+        json.dump(resumen, f, ensure_ascii=False)
+    os.replace(resumen_path + ".tmp", resumen_path)
+
+    # Eliminar páginas de versiones más viejas que la anterior
+    versiones_vigentes = [f"filas_{v}_" for v in (version, version_anterior) if v]
+    for nombre in os.listdir(directorio):
+        if nombre.startswith("filas_") and not any(nombre.startswith(prefijo) for prefijo in versiones_vigentes):
+            os.remove(os.path.join(directorio, nombre))
+
 # Función para generar reporte visual
 def generar_reporte_visual(resultados):
     activos = sum(1 for r in resultados if r["Detalles de la Baja"] == "Sin errores")
@@ -191,6 +327,185 @@ def generar_reporte_visual(resultados):
     plt.savefig("reporte.png")
     plt.show(block=False)  # Evita bloquear la interfaz gráfica
 
+# Cadencia de re-chequeo por estado del CUIT en el modo monitoreo
+INTERVALOS_RECHEQUEO = {
+    # Ventana de 24 h para el primer chequeo de los CUITs recién incorporados: como los re-chequeos
+    # siguientes suman días enteros, la hora del día de cada CUIT queda repartida en todo el día
+    "nuevo": datetime.timedelta(days=1),
+    "error": datetime.timedelta(days=1),
+    "ok": datetime.timedelta(days=30),
+    "fallo_api": datetime.timedelta(hours=1),  # Reintento cuando falló la consulta a AFIP o a Tango
+}
+
+class MonitorContinuo:
+    """Modo monitoreo: mantiene los clientes en memoria y re-chequea cada CUIT según su estado."""
+
+    def __init__(self, directorio_salida, consultas_por_dia=2000, intervalo_tango=datetime.timedelta(hours=4)):
+        if consultas_por_dia < 1:
+            raise ValueError(f"consultas_por_dia debe ser mayor o igual a 1: {consultas_por_dia}")
+        self.directorio_salida = directorio_salida
+        self.espaciado = 86400 / consultas_por_dia  # Segundos entre consultas para no superar el presupuesto diario
+        self.intervalo_tango = intervalo_tango
+        self.stop_event = Event()
+        self.cuits = {}  # CUIT normalizado -> clientes, estado, detalle y próximo chequeo
+        self.agenda = []  # Heap de (próximo chequeo, CUIT)
+        self.proximo_poll_tango = datetime.datetime.now()
+        self.archivo_errores = os.path.join(directorio_salida, "monitoreo_errores.csv")
+        self.directorio_dashboard = os.path.join(script_dir, 'dashboard_data')
+        self.problemas = {}  # CUIT normalizado -> último detalle de error registrado
+
+    def informar(self, mensaje):
+        logging.info(mensaje)
+        print(f"[{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {mensaje}")
+
+    def desfase(self, cuit, intervalo):
+        # Desfase fijo por CUIT para repartir los chequeos en la ventana en lugar de concentrarlos
+        segundos = max(1, int(intervalo.total_seconds()))
+        return datetime.timedelta(seconds=zlib.crc32(cuit.encode()) % segundos)
+
+    def cargar_problemas_registrados(self):
+        # Sembrar los problemas ya escritos en el CSV para no volver a registrarlos tras un reinicio
+        if not os.path.exists(self.archivo_errores):
+            return
+        try:
+            df = pd.read_csv(self.archivo_errores, dtype=str).fillna("")
+            for cuit, detalle in zip(df["Cuit"], df["Detalles de la Baja"]):
+                self.problemas[normalizar_cuit(cuit)] = detalle
+        except Exception as e:
+            logging.error(f"Error al leer los problemas registrados en {self.archivo_errores}: {e}")
+            print(f"Error al leer los problemas registrados en {self.archivo_errores}: {e}")
+            return
+        self.informar(f"Problemas ya registrados: {len(self.problemas)} CUITs")
+
+    def agendar(self, cuit, proximo):
+        self.cuits[cuit]["proximo_chequeo"] = proximo
+        heapq.heappush(self.agenda, (proximo, cuit))
+
+    def actualizar_clientes(self):
+        clientes = obtener_todos_los_clientes_tango()
+        if clientes is None:
+            # Solo una lectura completa de Tango puede dar de baja CUITs: si falló se conserva el conjunto anterior
+            logging.warning("No se obtuvieron todos los clientes de Tango; se conserva el conjunto anterior.")
+            return False
+        clientes = filtrar_clientes(clientes)
+
+        clientes_por_cuit = {}
+        for cliente in clientes:
+            cuit = normalizar_cuit(cliente["CUIT"])
+            if cuit:
+                clientes_por_cuit.setdefault(cuit, []).append(cliente)
+
+        ahora = datetime.datetime.now()
+        nuevos = [cuit for cuit in clientes_por_cuit if cuit not in self.cuits]
+        eliminados = [cuit for cuit in self.cuits if cuit not in clientes_por_cuit]
+        for cuit in eliminados:
+            del self.cuits[cuit]  # Sus entradas en la agenda se descartan al salir
+        for cuit, clientes_cuit in clientes_por_cuit.items():
+            if cuit in self.cuits:
+                self.cuits[cuit]["clientes"] = clientes_cuit
+            else:
+                self.cuits[cuit] = {"clientes": clientes_cuit, "estado": "nuevo", "detalle": None}
+                self.agendar(cuit, ahora + self.desfase(cuit, INTERVALOS_RECHEQUEO["nuevo"]))
+        self.informar(f"Clientes de Tango actualizados: {len(self.cuits)} CUITs ({len(nuevos)} nuevos, {len(eliminados)} eliminados)")
+        self.actualizar_dashboard()
+        return True
+
+    def siguiente_vencido(self, ahora):
+        while self.agenda and self.agenda[0][0] <= ahora:
+            proximo, cuit = heapq.heappop(self.agenda)
+            entrada = self.cuits.get(cuit)
+            # Entradas de CUITs eliminados o reagendados quedan obsoletas en el heap
+            if entrada and entrada["proximo_chequeo"] == proximo:
+                return cuit
+        return None
+
+    def chequear(self, cuit):
+        entrada = self.cuits[cuit]
+        ahora = datetime.datetime.now()
+        if not es_cuit_valido(cuit):
+            detalle = "CUIT con formato inválido"
+        else:
+            resultado_api = validar_cuit_afip_compartido(cuit)
+            if "error" in resultado_api:
+                self.agendar(cuit, ahora + INTERVALOS_RECHEQUEO["fallo_api"])
+                return
+            error = resultado_api.get("errorConstancia", {}).get("error", [])
+            detalle = ", ".join(error) if error else "Sin errores"
+
+        estado = "ok" if detalle == "Sin errores" else "error"
+        problemas_cambiaron = False
+        if estado == "error" and detalle != self.problemas.get(cuit):
+            self.registrar_problema(entrada["clientes"], detalle, ahora)
+            self.problemas[cuit] = detalle
+            problemas_cambiaron = True
+        elif estado == "ok" and cuit in self.problemas:
+            del self.problemas[cuit]
+            self.informar(f"CUIT {cuit} sin errores nuevamente")
+            problemas_cambiaron = True
+        entrada["estado"] = estado
+        entrada["detalle"] = detalle
+        self.agendar(cuit, ahora + INTERVALOS_RECHEQUEO[estado])
+        if problemas_cambiaron:
+            self.actualizar_dashboard()
+
+    def filas_problema(self, clientes, detalle):
+        return [{
+            "Código de Cliente": cliente.get("COD_GVA14", "N/A"),
+            "RAZON_SOCI": cliente.get("RAZON_SOCI", "N/A"),
+            "Cuit": cliente.get("CUIT", ""),
+            "Detalles de la Baja": detalle
+        } for cliente in clientes]
+
+    def registrar_problema(self, clientes, detalle, fecha):
+        resultados = self.filas_problema(clientes, detalle)
+        for resultado in resultados:
+            resultado["Fecha de Detección"] = fecha.strftime("%Y-%m-%d %H:%M:%S")
+        guardar_parcialmente(resultados, self.archivo_errores)
+        for resultado in resultados:
+            self.informar(f"Nuevo problema: {resultado['RAZON_SOCI']} - CUIT: {resultado['Cuit']} - {detalle}")
+
+    def actualizar_dashboard(self):
+        # Dashboard.html muestra los problemas vigentes de los clientes que siguen en Tango
+        resultados = []
+        for cuit, detalle in self.problemas.items():
+            if cuit in self.cuits:
+                resultados.extend(self.filas_problema(self.cuits[cuit]["clientes"], detalle))
+        try:
+            exportar_datos_dashboard(pd.DataFrame(resultados), self.directorio_dashboard)
+        except Exception as e:
+            logging.error(f"Error al actualizar los datos del dashboard: {e}")
+            print(f"Error al actualizar los datos del dashboard: {e}")
+
+    def ejecutar(self):
+        os.makedirs(self.directorio_salida, exist_ok=True)
+        self.informar(f"Monitoreo iniciado: una consulta cada {self.espaciado:.1f} s, errores en {self.archivo_errores}")
+        self.cargar_problemas_registrados()
+        while not self.stop_event.is_set():
+            ahora = datetime.datetime.now()
+            if ahora >= self.proximo_poll_tango:
+                try:
+                    completa = self.actualizar_clientes()
+                except Exception as e:
+                    logging.error(f"Error al actualizar los clientes de Tango: {e}")
+                    print(f"Error al actualizar los clientes de Tango: {e}")
+                    completa = False
+                # Si la lectura de Tango falló se reintenta antes del intervalo normal
+                self.proximo_poll_tango = ahora + (self.intervalo_tango if completa else INTERVALOS_RECHEQUEO["fallo_api"])
+            cuit = self.siguiente_vencido(ahora)
+            if cuit:
+                try:
+                    self.chequear(cuit)
+                except Exception as e:
+                    # El CUIT ya salió de la agenda: se vuelve a agendar para no dejar de monitorearlo
+                    logging.error(f"Error al chequear el CUIT {cuit}: {e}")
+                    print(f"Error al chequear el CUIT {cuit}: {e}")
+                    self.agendar(cuit, datetime.datetime.now() + INTERVALOS_RECHEQUEO["fallo_api"])
+            self.stop_event.wait(self.espaciado)
+        self.informar("Monitoreo detenido")
+
+    def detener(self):
+        self.stop_event.set()
+
 class ConsoleOutput(tk.Text):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
@@ -514,20 +829,36 @@ class ModernApp:
 
             self.progress["maximum"] = len(clientes_filtrados)
 
-            # Validar CUITS
+            # Validar CUITS: cada CUIT se consulta una sola vez y el resultado se reparte a todos sus clientes
             resultados_validacion = []
-            
-            for i, cliente in enumerate(clientes_filtrados):
-                if self.stop_event.is_set():
-                    break
+            clientes_por_cuit = {}
+            for cliente in clientes_filtrados:
+                cuit_limpio = normalizar_cuit(cliente.get("CUIT", ""))
+                if cuit_limpio and es_cuit_valido(cuit_limpio):
+                    clientes_por_cuit.setdefault(cuit_limpio, []).append(cliente)
+            self.print_console(f"CUITs distintos a validar: {len(clientes_por_cuit)}")
+
+            self.progress["value"] = 0
+            cuits_validados = 0
+
+            def al_completar(cuit_limpio):
+                nonlocal cuits_validados
+                cuits_validados += 1
+                clientes_cuit = clientes_por_cuit[cuit_limpio]
+                razones_sociales = ", ".join(cliente.get("RAZON_SOCI", "N/A") for cliente in clientes_cuit)
+                self.print_console(f"Procesado: {razones_sociales} - CUIT: {cuit_limpio}")
+                self.progress["value"] += len(clientes_cuit)
+                self.actualizar_estado(f"Validando CUIT {cuits_validados}/{len(clientes_por_cuit)}")
+
+            resultados_api = validar_cuits_agrupados(clientes_por_cuit, self.stop_event, al_completar)
+
+            # Generar una fila por cliente, en el orden original
+            for cliente in clientes_filtrados:
                 cod_gva14 = cliente.get("COD_GVA14", "N/A")
                 razon_social = cliente.get("RAZON_SOCI", "N/A")
                 cuit = cliente.get("CUIT", "")
 
-                self.actualizar_estado(f"Validando CUIT {i + 1}/{len(clientes_filtrados)}")
-                self.print_console(f"Procesando: {razon_social} - CUIT: {cuit}")
-
-                cuit_limpio = cuit.replace("-", "").replace(" ", "")
+                cuit_limpio = normalizar_cuit(cuit)
 
                 if not cuit_limpio:
                     continue
@@ -539,12 +870,12 @@ class ModernApp:
                         "Cuit": cuit,
                         "Detalles de la Baja": "CUIT con formato inválido"
                          })
-                    self.progress["value"] = i + 1
-                    self.root.update() 
+                    self.progress["value"] += 1
                     continue
 
                 try:
-                    resultado_api = validar_cuit_afip(int(cuit_limpio))
+                    # Sin resultado si el proceso se detuvo antes de consultar el CUIT o si la consulta falló
+                    resultado_api = resultados_api.get(cuit_limpio)
                     if resultado_api is None:
                         continue
 
@@ -564,12 +895,9 @@ class ModernApp:
                             "Detalles de la Baja": "Sin errores"
                          })
 
-                except ValueError:
-                    self.print_console(f"Error: CUIT inválido para {razon_social}")
                 except Exception as e:
                     self.print_console(f"Error procesando cliente {razon_social}: {str(e)}")
-                self.progress["value"] = i + 1
-                self.root.update()  # Actualizar la interfaz para mostrar el progreso
+            self.root.update()  # Actualizar la interfaz para mostrar el progreso
 
             # Generar Excel en el directorio seleccionado
             clientes_con_problemas = [r for r in resultados_validacion if r['Detalles de la Baja'] != "Sin errores"]
@@ -582,25 +910,18 @@ class ModernApp:
                     with pd.ExcelWriter(archivo_excel) as writer:
                         df.to_excel(writer, sheet_name='Clientes Invalidos', index=False)
                     self.print_console(f"Archivo Excel generado: {archivo_excel}")
-                     # Generar datos para el dashboard y actualizar v22.html
+                     # Generar datos para el dashboard (colores de los gráficos, agregados y páginas de filas)
                     chart_data_path = os.path.join(script_dir, 'chart_data.json')
-                    v22_html_path = os.path.join(script_dir, 'Dashboard.html')
-                    
+
                     #Pasar el dataframe a la funcion en analisis_avanzado
                     analisis_avanzado.process_data_for_chartjs(df,chart_data_path)
 
-
-                    with open(chart_data_path, 'r') as f:
-                        chart_data = json.load(f)
-                    with open(v22_html_path, 'r') as html_file:
-                        html_content = html_file.read()
-
-                    new_html_content = html_content.replace('// Datos para Chart.js', f'const chartData = {json.dumps(chart_data)};')
-                    with open(v22_html_path, 'w') as html_file:
-                        html_file.write(new_html_content)
+                    # Dashboard.html carga los agregados al inicio y pide las páginas de filas a demanda
+                    exportar_datos_dashboard(df, os.path.join(script_dir, 'dashboard_data'))
+                    self.print_console("Datos del dashboard actualizados")
 
                 except (FileNotFoundError, json.JSONDecodeError, KeyError, IOError, Exception) as e:
-                     self.print_console(f"Error al procesar datos para gráficos o actualizar v22.html: {e}")
+                     self.print_console(f"Error al procesar datos para gráficos o generar datos del dashboard: {e}")
                      self.actualizar_estado(f"Error: {e}")
             else:
                  self.print_console("No se encontraron clientes con errores. No se generó el archivo Excel.")
@@ -715,7 +1036,32 @@ class ModernApp:
             pass
         self.history_text.config(state=tk.DISABLED)
 
+# Tipo de argparse para enteros mayores o iguales a 1
+def entero_positivo(valor):
+    numero = int(valor)
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"debe ser un entero mayor o igual a 1: {valor}")
+    return numero
+
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = ModernApp(root)
-    root.mainloop()
+    parser = argparse.ArgumentParser(description="Bot de Validación en ARCA")
+    parser.add_argument("--monitoreo", action="store_true", help="Ejecuta el modo monitoreo continuo sin interfaz gráfica")
+    parser.add_argument("--salida", default=script_dir, help="Directorio donde se escriben los problemas detectados")
+    parser.add_argument("--consultas-por-dia", type=entero_positivo, default=2000, help="Presupuesto diario de consultas a la API de AFIP")
+    parser.add_argument("--intervalo-tango-horas", type=float, default=4, help="Horas entre actualizaciones de clientes desde Tango")
+    args = parser.parse_args()
+
+    if args.monitoreo:
+        monitor = MonitorContinuo(
+            args.salida,
+            consultas_por_dia=args.consultas_por_dia,
+            intervalo_tango=datetime.timedelta(hours=args.intervalo_tango_horas)
+        )
+        try:
+            monitor.ejecutar()
+        except KeyboardInterrupt:
+            monitor.detener()
+    else:
+        root = tk.Tk()
+        app = ModernApp(root)
+        root.mainloop()